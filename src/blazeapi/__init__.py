@@ -2,7 +2,7 @@
 
 __version__ = "0.1.1"
 
-from blazeapi.app import BlazeAPI
+from blazeapi.app import BlazeAPI, sync_fast
 from blazeapi.request import Request
 from blazeapi.response import JSONResponse, Response
 from blazeapi.routing import Route, Router
@@ -14,4 +14,5 @@ __all__ = [
     "Response",
     "Route",
     "Router",
+    "sync_fast",
 ]
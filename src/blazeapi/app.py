@@ -1,30 +1,80 @@
 """BlazeAPI ASGI application."""
 
 import asyncio
+import functools
 import inspect
 import sys
 import traceback
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable, Mapping
 from pathlib import Path
 from typing import Any
 
-from blazeapi._types import ASGIApp, Receive, Scope, Send
+from pydantic import BaseModel
+
+from blazeapi._types import ASGIApp, Hook, Receive, Scope, Send
 from blazeapi.request import Request
 from blazeapi.response import JSONResponse, Response
-from blazeapi.routing import Router
+from blazeapi.routing import _PARAM_RE, Router
+
+# Shared kwargs for handlers that take no arguments; ``**`` never mutates it.
+_NO_KWARGS: dict[str, Any] = {}
+
+# Result types auto-serialized as JSON by ``_send_response``.
+_JSON_TYPES = (dict, list)
+
+# Marker attribute for sync handlers that may run directly on the event loop.
+_SYNC_INLINE_ATTR = "__blaze_sync_fast__"
+
+
+def sync_fast(handler: Callable[..., Any]) -> Callable[..., Any]:
+    """Mark a sync handler as safe to run directly on the event loop.
+
+    Skips the thread-executor round trip. Only use it for handlers that
+    never block (no I/O, no sleeps, no heavy CPU work). It may be applied
+    above or below the route decorator.
+    """
+    setattr(handler, _SYNC_INLINE_ATTR, True)
+    return handler
 
 
 class _HandlerMeta:
     """Pre-computed handler metadata, built once at registration time."""
 
-    __slots__ = ("handler", "is_coroutine", "param_names", "wants_request")
-
-    def __init__(self, handler: Callable[..., Any]) -> None:
+    __slots__ = (
+        "arg_names",
+        "handler",
+        "invoker",
+        "is_coroutine",
+        "param_names",
+        "send",
+        "sync_inline",
+        "wants_request",
+    )
+
+    def __init__(self, handler: Callable[..., Any], path: str, return_type: Any = None) -> None:
         self.handler = handler
         self.is_coroutine = asyncio.iscoroutinefunction(handler)
-        sig = inspect.signature(handler)
-        self.wants_request = "request" in sig.parameters
-        self.param_names = frozenset(sig.parameters.keys()) - {"request"}
+        self.sync_inline = not self.is_coroutine and bool(getattr(handler, _SYNC_INLINE_ATTR, False))
+        self.invoker: Callable[[dict[str, Any]], Awaitable[Any]]
+        if self.is_coroutine or self.sync_inline:
+            self.invoker = _make_invoker(handler, is_coroutine=self.is_coroutine, inline=self.sync_inline)
+        else:
+            # ``@sync_fast`` may be stacked above the route decorator, marking the
+            # handler only after registration; settle the invoker on first call.
+            self.invoker = self._first_invoke
+        names = _parameter_names(handler)
+        self.wants_request = "request" in names
+        self.param_names = frozenset(names) - {"request"}
+        # Path params the handler accepts — always present once the route matched.
+        self.arg_names: tuple[str, ...] = tuple(
+            m.group(1) for m in _PARAM_RE.finditer(path) if m.group(1) in self.param_names
+        )
+        self.send = _make_sender(return_type)
+
+    def _first_invoke(self, kwargs: dict[str, Any]) -> Awaitable[Any]:
+        self.sync_inline = bool(getattr(self.handler, _SYNC_INLINE_ATTR, False))
+        self.invoker = _make_invoker(self.handler, is_coroutine=False, inline=self.sync_inline)
+        return self.invoker(kwargs)
 
 
 class BlazeAPI:
@@ -44,7 +94,8 @@ class BlazeAPI:
         self.strict = strict
         self.debug = debug
         self._middleware: list[Callable[[ASGIApp], ASGIApp]] = []
-        self._handler_meta: dict[Callable[..., Any], _HandlerMeta] = {}
+        self._pre_hooks: list[Hook] = []
+        self._post_hooks: list[Hook] = []
         self._app: ASGIApp | None = None
 
     # ------------------------------------------------------------------
@@ -53,12 +104,13 @@ class BlazeAPI:
 
     def _route(self, method: str, path: str) -> Callable[..., Any]:
         def decorator(handler: Callable[..., Any]) -> Callable[..., Any]:
+            return_type = None
             if self.strict:
                 from blazeapi.validation import validate_handler_signature
 
-                validate_handler_signature(handler, path, method)
-            self.router.add_route(method, path, handler)
-            self._handler_meta[handler] = _HandlerMeta(handler)
+                return_type = validate_handler_signature(handler, path, method)
+            route = self.router.add_route(method, path, handler)
+            route.meta = _HandlerMeta(handler, path, return_type)
             return handler
 
         return decorator
@@ -84,6 +136,8 @@ class BlazeAPI:
     def head(self, path: str) -> Callable[..., Any]:
         return self._route("HEAD", path)
 
+    sync_fast = staticmethod(sync_fast)
+
     # ------------------------------------------------------------------
     # Middleware
     # ------------------------------------------------------------------
@@ -96,8 +150,22 @@ class BlazeAPI:
         self._middleware.append(middleware)
         self._app = None  # invalidate cached chain
 
+    def add_pre_hook(self, hook: Hook) -> None:
+        """Register ``await hook(scope)`` to run before each request is routed.
+
+        Hooks run in registration order, inside all middleware, and cost a
+        plain call each instead of an extra ASGI wrapper layer.
+        """
+        self._pre_hooks.append(hook)
+        self._app = None
+
+    def add_post_hook(self, hook: Hook) -> None:
+        """Register ``await hook(scope)`` to run after each response is sent."""
+        self._post_hooks.append(hook)
+        self._app = None
+
     def _build_app(self) -> ASGIApp:
-        app: ASGIApp = self._handle
+        app: ASGIApp = _with_hooks(self._handle, tuple(self._pre_hooks), tuple(self._post_hooks))
         for mw in reversed(self._middleware):
             app = mw(app)
         return app
@@ -125,34 +193,42 @@ class BlazeAPI:
             return
 
         route, path_params = result
-        request = Request(scope, receive, path_params)
+        meta: _HandlerMeta = route.meta
+        # Handlers that don't take ``request`` never see one, so don't build it.
+        request = Request(scope, receive, path_params) if meta.wants_request else None
 
         try:
-            response = await self._invoke(route.handler, request, path_params)
-        except Exception:
-            body: dict[str, Any] = {"detail": "Internal Server Error"}
-            if self.debug:
-                body["traceback"] = traceback.format_exc()
-            await JSONResponse(body, status_code=500).send(send)
+            response = await self._invoke(meta, request, path_params)
+        except Exception as exc:
+            await self._send_500(send, exc)
             return
 
-        await _send_response(response, send)
+        await meta.send(response, send)
+
+    async def _send_500(self, send: Send, exc: Exception) -> None:
+        """Report an unhandled handler error; kept out of ``_handle``'s hot path."""
+        body: dict[str, Any] = {"detail": "Internal Server Error"}
+        if self.debug:
+            body["traceback"] = "".join(traceback.format_exception(exc))
+        await JSONResponse(body, status_code=500).send(send)
 
     async def _invoke(
         self,
-        handler: Callable[..., Any],
-        request: Request,
-        path_params: dict[str, Any],
+        meta: _HandlerMeta,
+        request: Request | None,
+        path_params: Mapping[str, Any],
     ) -> Any:
-        meta = self._handler_meta[handler]
-        kwargs: dict[str, Any] = {name: path_params[name] for name in meta.param_names if name in path_params}
-        if meta.wants_request:
-            kwargs["request"] = request
-
-        if meta.is_coroutine:
-            return await handler(**kwargs)
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, lambda: handler(**kwargs))
+        arg_names = meta.arg_names
+        kwargs: dict[str, Any]
+        if arg_names:
+            kwargs = {name: path_params[name] for name in arg_names}
+            if meta.wants_request:
+                kwargs["request"] = request
+        elif meta.wants_request:
+            kwargs = {"request": request}
+        else:
+            kwargs = _NO_KWARGS
+        return await meta.invoker(kwargs)
 
     # ------------------------------------------------------------------
     # Granian convenience
@@ -250,10 +326,108 @@ async def _handle_lifespan(receive: Receive, send: Send) -> None:
             return
 
 
+def _with_hooks(app: ASGIApp, pre: tuple[Hook, ...], post: tuple[Hook, ...]) -> ASGIApp:
+    """Fuse pre/post hooks around *app* into a single ASGI callable."""
+    if not pre and not post:
+        return app
+
+    async def hooked(scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            # Not routed (e.g. websockets), so not a request the hooks should see.
+            await app(scope, receive, send)
+            return
+        for hook in pre:
+            await hook(scope)
+        await app(scope, receive, send)
+        for hook in post:
+            await hook(scope)
+
+    return hooked
+
+
+def _parameter_names(handler: Callable[..., Any]) -> tuple[str, ...]:
+    """Return the names *handler* accepts as keywords, without building a signature.
+
+    Reads the code object directly; callables without one (partials, class
+    instances) fall back to :func:`inspect.signature`.
+    """
+    fn = inspect.unwrap(handler)
+    code = getattr(fn, "__code__", None)
+    if code is None:
+        return tuple(inspect.signature(handler).parameters)
+    names = code.co_varnames[: code.co_argcount + code.co_kwonlyargcount]
+    if inspect.ismethod(handler) or inspect.ismethod(fn):
+        names = names[1:]  # drop the bound ``self``/``cls``
+    return names
+
+
+def _make_invoker(
+    handler: Callable[..., Any],
+    *,
+    is_coroutine: bool,
+    inline: bool,
+) -> Callable[[dict[str, Any]], Awaitable[Any]]:
+    """Return a callable that runs *handler* with kwargs and yields an awaitable.
+
+    Async handlers hand back their own coroutine; sync handlers run in the
+    default executor unless *inline* opts them into running on the loop.
+    """
+    if is_coroutine:
+
+        def call_async(kwargs: dict[str, Any]) -> Awaitable[Any]:
+            return handler(**kwargs)
+
+        return call_async
+
+    if inline:
+
+        async def call_inline(kwargs: dict[str, Any]) -> Any:
+            return handler(**kwargs)
+
+        return call_inline
+
+    async def call_in_executor(kwargs: dict[str, Any]) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(handler, **kwargs))
+
+    return call_in_executor
+
+
+def _make_sender(return_type: Any) -> Callable[[Any, Send], Awaitable[None]]:
+    """Pick how to send a handler's result from its (strict-mode) return type.
+
+    Validated ``Response`` and ``BaseModel`` annotations skip the per-request
+    type dispatch in :func:`_send_response`; anything else keeps it.
+    """
+    if isinstance(return_type, type):
+        if issubclass(return_type, Response):
+            return _send_response_object
+        if issubclass(return_type, BaseModel):
+            return _send_model
+    return _send_response
+
+
+async def _send_response_object(response: Response, send: Send) -> None:
+    try:
+        send_response = response.send
+    except AttributeError:
+        # The handler broke its annotation (e.g. returned a dict); dispatch on type instead.
+        await _send_response(response, send)
+        return
+    await send_response(send)
+
+
+async def _send_model(response: BaseModel, send: Send) -> None:
+    if isinstance(response, BaseModel):
+        await JSONResponse(response).send(send)
+    else:
+        await _send_response(response, send)
+
+
 async def _send_response(response: Any, send: Send) -> None:
     if isinstance(response, Response):
         await response.send(send)
-    elif isinstance(response, dict | list):
+    elif isinstance(response, _JSON_TYPES):
         await JSONResponse(response).send(send)
     else:
         await Response(str(response).encode("utf-8")).send(send)
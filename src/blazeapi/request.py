@@ -2,66 +2,231 @@
 
 from __future__ import annotations
 
-import json
-from typing import TYPE_CHECKING, Any
-from urllib.parse import parse_qs
+from typing import TYPE_CHECKING, Any, TypeVar
+from urllib.parse import unquote_plus
+
+from blazeapi.routing import _EMPTY_PARAMS
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # optional: pip install 'blazeapi[orjson]'
+    from json import loads as _json_loads
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterator, Mapping
+
+    from pydantic import BaseModel
+
     from blazeapi._types import Receive, Scope
 
+_ModelT = TypeVar("_ModelT", bound="BaseModel")
+
 
 class Request:
     """Thin wrapper around an ASGI *scope* and *receive* callable."""
 
-    __slots__ = ("_body", "_receive", "_scope", "path_params")
+    # Ordered by how often a request touches them: hot fields first, so they
+    # share cache lines with the object header.
+    __slots__ = (  # noqa: RUF023
+        "_scope",
+        "path_params",
+        "_receive",
+        "_body",
+        "_body_read",
+        "method",
+        "path",
+        "query_string",
+        "_headers_raw",
+        "_headers",
+        "_query",
+        "_query_params",
+        "_text",
+        "_stream_consumed",
+    )
 
     def __init__(
         self,
         scope: Scope,
         receive: Receive,
-        path_params: dict[str, Any] | None = None,
+        path_params: Mapping[str, Any] | None = None,
     ) -> None:
         self._scope = scope
         self._receive = receive
-        self._body: bytes | None = None
-        self.path_params: dict[str, Any] = path_params or {}
-
-    @property
-    def method(self) -> str:
-        return self._scope["method"]
+        # Read once here rather than through a property on every access.
+        self.method: str = scope["method"]
+        self.path: str = scope["path"]
+        self.query_string: bytes = scope["query_string"]  # required on http scopes by the ASGI spec
+        # Always bytes, with a separate flag, so the attribute's type never changes.
+        self._body = b""
+        self._body_read = False
+        self._query_params: dict[str, list[str]] | None = None
+        self._query: dict[str, str | list[str]] | None = None
+        self._headers: dict[str, str] | None = None
+        self._headers_raw: dict[bytes, bytes] | None = None
+        self._text: tuple[str, str] | None = None  # (encoding, decoded body)
+        self._stream_consumed = False
+        self.path_params: Mapping[str, Any] = path_params if path_params is not None else _EMPTY_PARAMS
 
     @property
-    def path(self) -> str:
-        return self._scope["path"]
+    def query_params(self) -> dict[str, list[str]]:
+        """Parsed query string, with the same result as :func:`urllib.parse.parse_qs`."""
+        params = self._query_params
+        if params is None:
+            params = self._query_params = _parse_query(self.query_string.decode("latin-1"))
+        return params
 
     @property
-    def query_string(self) -> bytes:
-        return self._scope.get("query_string", b"")
+    def query(self) -> dict[str, str | list[str]]:
+        """Parsed query string with one ``str`` per key.
 
-    @property
-    def query_params(self) -> dict[str, list[str]]:
-        return parse_qs(self.query_string.decode("latin-1"))
+        A key that appears more than once maps to a ``list`` of its values
+        instead, so the common single-valued case allocates no lists.
+        """
+        query = self._query
+        if query is None:
+            query = self._query = _parse_query_single(self.query_string.decode("latin-1"))
+        return query
 
     @property
     def headers(self) -> dict[str, str]:
         """Headers as a lowercase-keyed dict (last value wins for dupes)."""
-        return {k.decode("latin-1"): v.decode("latin-1") for k, v in self._scope.get("headers", [])}
+        headers = self._headers
+        if headers is None:
+            raw = self._raw_headers()
+            # Headers are nearly always ASCII, which decodes faster than latin-1.
+            # Names are client data, so they are deliberately not interned:
+            # interned strings are immortal on 3.12 and would leak per new name.
+            # Comprehensions are inlined since 3.12 (PEP 709) and measure as fast
+            # as an explicit ``d[k] = v`` loop or ``dict(zip(...))`` for 8-128
+            # headers, so keep them.
+            try:
+                headers = {k.decode("ascii"): v.decode("ascii") for k, v in raw.items()}
+            except UnicodeDecodeError:
+                headers = {k.decode("latin-1"): v.decode("latin-1") for k, v in raw.items()}
+            self._headers = headers
+        return headers
+
+    def get_header(self, name: str) -> str | None:
+        """Return one header's value (last wins), decoding only that value."""
+        value = self._raw_headers().get(name.lower().encode("latin-1"))
+        return None if value is None else value.decode("latin-1")
+
+    def _raw_headers(self) -> dict[bytes, bytes]:
+        raw = self._headers_raw
+        if raw is None:
+            raw = self._headers_raw = dict(self._scope.get("headers", ()))
+        return raw
 
     async def body(self) -> bytes:
         """Read and cache the full request body."""
-        if self._body is not None:
+        if self._body_read:
             return self._body
-        chunks: list[bytes] = []
+        if self._stream_consumed:
+            raise RuntimeError("Request body was already consumed by stream()")
+        receive = self._receive
+        message = await receive()
+        if not message.get("more_body", False):
+            # Single-message body (the common case): keep it as-is, no copy.
+            body = self._body = message.get("body", b"")
+            self._body_read = True
+            return body
+
+        buf = bytearray(message.get("body", b""))
+        while message.get("more_body", False):
+            message = await receive()
+            buf.extend(message.get("body", b""))
+        body = self._body = bytes(buf)
+        self._body_read = True
+        return body
+
+    async def stream(self) -> AsyncIterator[bytes]:
+        """Yield body chunks as they arrive, without buffering the whole body.
+
+        If :meth:`body` already ran, the cached bytes are yielded instead.
+        The stream can be consumed only once, and :meth:`body` cannot be
+        called after it.
+        """
+        if self._body_read:
+            if self._body:
+                yield self._body
+            return
+        if self._stream_consumed:
+            raise RuntimeError("Request body was already consumed by stream()")
+        self._stream_consumed = True
+        receive = self._receive
         while True:
-            message = await self._receive()
+            message = await receive()
             chunk = message.get("body", b"")
             if chunk:
-                chunks.append(chunk)
+                yield chunk
             if not message.get("more_body", False):
-                break
-        self._body = b"".join(chunks)
-        return self._body
+                return
+
+    async def text(self, encoding: str = "utf-8") -> str:
+        """Read the body and decode it once; repeat calls return the cached str."""
+        cached = self._text
+        if cached is not None and cached[0] == encoding:
+            return cached[1]
+        text = (await self.body()).decode(encoding)
+        self._text = (encoding, text)
+        return text
 
     async def json(self) -> Any:
-        """Parse the request body as JSON."""
-        return json.loads(await self.body())
+        """Parse the request body as JSON (with :mod:`orjson` when installed)."""
+        return _json_loads(await self.body())
+
+    async def json_as(self, model_cls: type[_ModelT]) -> _ModelT:
+        """Validate the JSON body straight into *model_cls*.
+
+        Uses pydantic-core's parser on the raw bytes, so no intermediate
+        ``dict`` is built as with ``model_cls(**await request.json())``.
+        Raises :class:`pydantic.ValidationError` on bad input.
+        """
+        return model_cls.model_validate_json(await self.body())
+
+
+def _parse_query(qs: str) -> dict[str, list[str]]:
+    """Split ``a=1&b=2&a=3`` into ``{"a": ["1", "3"], "b": ["2"]}``."""
+    result: dict[str, list[str]] = {}
+    for key, value in _iter_query(qs):
+        values = result.get(key)
+        if values is None:
+            result[key] = [value]
+        else:
+            values.append(value)
+    return result
+
+
+def _iter_query(qs: str) -> Iterator[tuple[str, str]]:
+    """Yield decoded ``(key, value)`` pairs from a raw query string.
+
+    Matches ``parse_qs`` defaults (pairs without a value are dropped) but only
+    unquotes tokens that actually contain ``%`` or ``+``.
+    """
+    if not qs:
+        return
+    for pair in qs.split("&"):
+        eq = pair.find("=")
+        if eq < 0 or eq == len(pair) - 1:
+            continue
+        key = pair[:eq]
+        value = pair[eq + 1 :]
+        if "%" in key or "+" in key:
+            key = unquote_plus(key)
+        if "%" in value or "+" in value:
+            value = unquote_plus(value)
+        yield key, value
+
+
+def _parse_query_single(qs: str) -> dict[str, str | list[str]]:
+    """Like :func:`_parse_query`, but single-valued keys map to a plain ``str``."""
+    result: dict[str, str | list[str]] = {}
+    for key, value in _iter_query(qs):
+        prev = result.get(key)
+        if prev is None:
+            result[key] = value
+        elif isinstance(prev, list):
+            prev.append(value)
+        else:
+            result[key] = [prev, value]
+    return result
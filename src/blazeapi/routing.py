@@ -3,10 +3,20 @@
 from __future__ import annotations
 
 import re
-from typing import TYPE_CHECKING, Any
+import sys
+from types import MappingProxyType, ModuleType
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+re2: ModuleType | None
+try:
+    import re2 as _re2
+except ImportError:  # optional: pip install 'blazeapi[re2]'
+    re2 = None
+else:
+    re2 = _re2
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Mapping
 
 _PARAM_RE = re.compile(r"\{(\w+)(?::(\w+))?\}")
 
@@ -21,11 +31,46 @@ _PARAM_TYPES: dict[str, tuple[str, Callable[[str], Any]]] = {
     "path": (r".+", str),
 }
 
+# Shared, read-only params for routes without placeholders, also used by
+# ``Request`` when it is built without path params.
+_EMPTY_PARAMS: Mapping[str, Any] = MappingProxyType({})
+
+# Slots in the direct-mapped dynamic-match cache (must be a power of two).
+_CACHE_SIZE = 512
+_CACHE_MASK = _CACHE_SIZE - 1
+
+
+def _is_int_segment(seg: str) -> bool:
+    """Accept what the ``int`` regex does, via ``str.isdecimal`` instead of ``re``."""
+    return seg.isdecimal() or (seg[:1] == "-" and seg[1:].isdecimal())
+
+
+# Per-segment validators used by the trie.  ``None`` means any non-empty
+# segment is accepted (``[^/]+`` against a segment that never holds a slash).
+_SEGMENT_CHECKS: dict[str, Callable[[str], Any] | None] = {
+    name: None if name == "str" else re.compile(regex).fullmatch for name, (regex, _) in _PARAM_TYPES.items()
+}
+_SEGMENT_CHECKS["int"] = _is_int_segment
+
+
+class _Literal(NamedTuple):
+    value: str
+
+
+class _Param(NamedTuple):
+    name: str
+    type_name: str
+    converter: Callable[[str], Any]
+
+
+class _Catchall(NamedTuple):
+    name: str
+
 
 class Route:
     """A single route mapping a method + path pattern to a handler."""
 
-    __slots__ = ("_converters", "_pattern", "handler", "method", "path")
+    __slots__ = ("_match", "_param_specs", "_segments", "_tier", "handler", "is_literal", "meta", "method", "path")
 
     def __init__(
         self,
@@ -33,29 +78,105 @@ class Route:
         path: str,
         handler: Callable[..., Any],
     ) -> None:
-        self.method = method.upper()
-        self.path = path
+        # Interned so dict lookups keyed on them can short-circuit on identity.
+        self.method = sys.intern(method.upper())
+        self.path = sys.intern(path)
         self.handler = handler
-        self._pattern, self._converters = _compile_pattern(path)
+        # Opaque per-route data owned by the application (e.g. handler metadata).
+        self.meta: Any = None
+        self.is_literal = "{" not in path
+        pattern, self._param_specs = _compile_pattern(path)
+        self._segments, self._tier = _split_segments(path)
+        # Bound once so each match() is a single C call.
+        self._match = pattern.match
 
-    def match(self, path: str) -> dict[str, Any] | None:
+    def match(self, path: str) -> Mapping[str, Any] | None:
         """Return converted path params if *path* matches, else ``None``."""
-        m = self._pattern.match(path)
+        if self.is_literal:
+            return _EMPTY_PARAMS if path == self.path else None
+        m = self._match(path)
         if m is None:
             return None
-        return {name: self._converters[name](value) for name, value in m.groupdict().items()}
+        specs = self._param_specs
+        if not specs:
+            return _EMPTY_PARAMS
+        return {name: conv(value) for (name, conv), value in zip(specs, m.groups(), strict=True)}
 
     def __repr__(self) -> str:
         return f"Route({self.method!r}, {self.path!r})"
 
 
+class _TrieNode:
+    """One path segment in a per-method routing tree."""
+
+    __slots__ = ("catchall", "children", "leaf", "params", "patterns")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TrieNode] = {}
+        self.params: dict[str, _TrieNode] = {}  # keyed by param type name
+        self.catchall: _Leaf | None = None
+        self.leaf: _Leaf | None = None
+        self.patterns: _Patterns | None = None
+
+
+class _Patterns:
+    """Regex-matched routes hanging off the tree node where their path leaves it.
+
+    ``mixed`` routes split on a segment that embeds a parameter in literal
+    text (``{year:int}.csv``) and rank between literal and parameter
+    children.  ``tail`` routes split on a ``{name:path}`` that is not the
+    last segment and rank between parameters and the catch-all.  Each list is
+    packed into one alternation regex, first registered leftmost, rebuilt
+    lazily on the first match after a change.
+    """
+
+    __slots__ = ("compile_", "dirty", "mixed", "mixed_re", "tail", "tail_re")
+
+    def __init__(self, compile_: Callable[[str], Any]) -> None:
+        self.compile_ = compile_
+        self.dirty = True
+        self.mixed: list[Route] = []
+        self.tail: list[Route] = []
+        self.mixed_re: _Combined | None = None
+        self.tail_re: _Combined | None = None
+
+    def build(self) -> None:
+        compile_ = self.compile_
+        self.mixed_re = _combine(self.mixed, compile_) if self.mixed else None
+        self.tail_re = _combine(self.tail, compile_) if self.tail else None
+        self.dirty = False
+
+
+if TYPE_CHECKING:
+    _Segment = _Literal | _Param | _Catchall
+    # (route, ((param_name, converter), ...)) stored at a tree leaf
+    _Leaf = tuple[Route, tuple[tuple[str, Callable[[str], Any]], ...]]
+    # an ``re`` or ``re2`` pattern + the route whose alternative opens at each group index
+    _Combined = tuple[Any, list[Route | None]]
+
+
 class Router:
-    """Ordered collection of routes with first-match-wins lookup."""
+    """Collection of routes indexed by a per-method segment tree.
 
-    __slots__ = ("routes",)
+    Paths without placeholders are resolved by a single dict lookup, and
+    recent dynamic matches are remembered in a small direct-mapped cache.
+    Otherwise literal segments are preferred over typed parameters, which are
+    preferred over ``{name:path}`` catch-alls; among equally specific routes
+    the first registered wins.  Patterns the tree cannot express (e.g. a
+    parameter embedded in a literal segment) hang off the node where they
+    leave the tree and are ranked against its children there (see
+    :class:`_Patterns`).
+    """
+
+    __slots__ = ("_cache", "_compile", "_patterns", "_static", "_tries", "routes")
 
     def __init__(self) -> None:
         self.routes: list[Route] = []
+        self._compile: Callable[[str], Any] = re.compile
+        self._static: dict[tuple[str, str], Route] = {}
+        self._cache: list[tuple[str, str, Route, Mapping[str, Any]] | None] = [None] * _CACHE_SIZE
+        self._tries: dict[str, _TrieNode] = {}  # every registered method has a root
+        self._patterns: list[_Patterns] = []  # every node's regex tiers, for enable_re2()
 
     def add_route(
         self,
@@ -65,29 +186,245 @@ class Router:
     ) -> Route:
         route = Route(method, path, handler)
         self.routes.append(route)
+        if route.is_literal:
+            self._static.setdefault((route.method, route.path), route)
+        root = self._tries.get(route.method)
+        if root is None:
+            root = self._tries[route.method] = _TrieNode()
+        if route._tier is None:
+            _insert(root, route, route._segments)
+        else:
+            patterns, created = _insert_pattern(root, route, self._compile)
+            if created:
+                self._patterns.append(patterns)
+        self._cache = [None] * _CACHE_SIZE
         return route
 
+    def enable_re2(self) -> None:
+        """Compile the combined route regexes with RE2 instead of :mod:`re`.
+
+        RE2 matches in linear time, so patterns cannot backtrack
+        pathologically.  Its ``\\d`` only matches ASCII digits.  Requires the
+        optional ``re2`` extra (``google-re2``).
+        """
+        if re2 is None:
+            raise RuntimeError("Router.enable_re2() requires google-re2: pip install 'blazeapi[re2]'")
+        self._compile = re2.compile
+        for patterns in self._patterns:
+            patterns.compile_ = re2.compile
+            patterns.dirty = True
+        # Matches made under ``re`` may differ (e.g. non-ASCII digits), so drop them.
+        self._cache = [None] * _CACHE_SIZE
+
     def match(
         self,
         method: str,
         path: str,
-    ) -> tuple[Route, dict[str, Any]] | None:
-        """Return ``(route, params)`` for the first match, or ``None``."""
-        method = method.upper()
-        for route in self.routes:
-            if route.method != method:
+    ) -> tuple[Route, Mapping[str, Any]] | None:
+        """Return ``(route, params)`` for the best match, or ``None``."""
+        tries = self._tries
+        if method not in tries:
+            # ASGI servers send uppercase methods; only normalize the rare exception.
+            method = method.upper()
+            if method not in tries:
+                return None
+        hit = self._static.get((method, path))
+        if hit is not None:
+            return hit, _EMPTY_PARAMS
+
+        slot = hash((method, path)) & _CACHE_MASK
+        entry = self._cache[slot]
+        if entry is not None and entry[0] == method and entry[1] == path:
+            return entry[2], entry[3]
+
+        result = self._match_dynamic(method, path)
+        if result is not None:
+            route, params = result
+            # Cached params are shared between requests, so hand out a read-only view.
+            frozen = MappingProxyType(params)
+            self._cache[slot] = (method, path, route, frozen)
+            return route, frozen
+        return None
+
+    def _match_dynamic(self, method: str, path: str) -> tuple[Route, dict[str, Any]] | None:
+        root = self._tries.get(method)
+        if root is None:
+            return None
+        values: list[str] = []
+        leaf = _descend(root, path.split("/"), 0, values)
+        if leaf is None:
+            return None
+        route, specs = leaf
+        return route, {name: conv(value) for (name, conv), value in zip(specs, values, strict=True)}
+
+
+def _insert(root: _TrieNode, route: Route, segments: tuple[_Segment, ...]) -> None:
+    """Add *route* to the tree rooted at *root*, keeping any earlier leaf."""
+    node = root
+    specs: list[tuple[str, Callable[[str], Any]]] = []
+    for seg in segments:
+        if isinstance(seg, _Literal):
+            child = node.children.get(seg.value)
+            if child is None:
+                child = node.children[seg.value] = _TrieNode()
+        elif isinstance(seg, _Param):
+            child = node.params.get(seg.type_name)
+            if child is None:
+                child = node.params[seg.type_name] = _TrieNode()
+            specs.append((seg.name, seg.converter))
+        else:
+            specs.append((seg.name, str))
+            if node.catchall is None:
+                node.catchall = (route, tuple(specs))
+            return
+        node = child
+    if node.leaf is None:
+        node.leaf = (route, tuple(specs))
+
+
+def _insert_pattern(
+    root: _TrieNode,
+    route: Route,
+    compile_: Callable[[str], Any],
+) -> tuple[_Patterns, bool]:
+    """Hang regex-matched *route* off the node its leading segments lead to.
+
+    Returns the node's :class:`_Patterns`, marked for rebuild, and whether
+    it was created by this call.
+    """
+    node = root
+    for seg in route._segments:
+        if isinstance(seg, _Literal):
+            child = node.children.get(seg.value)
+            if child is None:
+                child = node.children[seg.value] = _TrieNode()
+        else:
+            assert isinstance(seg, _Param)  # a catch-all always ends the tree part
+            child = node.params.get(seg.type_name)
+            if child is None:
+                child = node.params[seg.type_name] = _TrieNode()
+        node = child
+    patterns = node.patterns
+    created = patterns is None
+    if patterns is None:
+        patterns = node.patterns = _Patterns(compile_)
+    (patterns.mixed if route._tier == "mixed" else patterns.tail).append(route)
+    patterns.dirty = True
+    return patterns, created
+
+
+def _descend(node: _TrieNode, segs: list[str], i: int, values: list[str]) -> _Leaf | None:
+    """Walk *segs* from index *i*, collecting raw param values into *values*.
+
+    Nodes that leave only one way forward are walked in a loop; recursion
+    (and backtracking) is reserved for nodes where several children apply.
+    """
+    n = len(segs)
+    while i < n:
+        seg = segs[i]
+        params = node.params
+        if node.catchall is None and node.patterns is None:
+            if not params:
+                child = node.children.get(seg)
+                if child is None:
+                    return None
+                node = child
+                i += 1
+                continue
+            if len(params) == 1 and seg and seg not in node.children:
+                ((type_name, child),) = params.items()
+                check = _SEGMENT_CHECKS[type_name]
+                if check is not None and not check(seg):
+                    return None
+                values.append(seg)
+                node = child
+                i += 1
+                continue
+        return _branch(node, segs, i, values)
+    return node.leaf
+
+
+def _branch(node: _TrieNode, segs: list[str], i: int, values: list[str]) -> _Leaf | None:
+    """Try literal, mixed-regex, typed-param, tail-regex, then catch-all children of *node*."""
+    seg = segs[i]
+    mark = len(values)
+    child = node.children.get(seg)
+    if child is not None:
+        leaf = _descend(child, segs, i + 1, values)
+        if leaf is not None:
+            return leaf
+        del values[mark:]
+
+    patterns = node.patterns
+    if patterns is not None and patterns.dirty:
+        patterns.build()
+    if patterns is not None and patterns.mixed_re is not None:
+        leaf = _match_combined(patterns.mixed_re, "/".join(segs), values)
+        if leaf is not None:
+            return leaf
+
+    if seg:
+        for type_name, child in node.params.items():
+            check = _SEGMENT_CHECKS[type_name]
+            if check is not None and not check(seg):
                 continue
-            params = route.match(path)
-            if params is not None:
-                return route, params
+            values.append(seg)
+            leaf = _descend(child, segs, i + 1, values)
+            if leaf is not None:
+                return leaf
+            del values[mark:]
+
+    if patterns is not None and patterns.tail_re is not None:
+        leaf = _match_combined(patterns.tail_re, "/".join(segs), values)
+        if leaf is not None:
+            return leaf
+
+    if node.catchall is not None:
+        rest = "/".join(segs[i:])
+        if rest:
+            values.append(rest)
+            return node.catchall
+    return None
+
+
+def _match_combined(combined: _Combined, path: str, values: list[str]) -> _Leaf | None:
+    """Match *path* against a tier's alternation, replacing *values* on a hit.
+
+    Each route's regex covers the whole path, so its groups supersede any
+    values the tree collected on the way down.
+    """
+    pattern, owners = combined
+    m = pattern.match(path)
+    if m is None:
         return None
+    group = m.lastindex
+    assert group is not None  # every alternative is a capturing group
+    route = owners[group]
+    assert route is not None  # lastindex is always an alternative's outer group
+    specs = route._param_specs
+    values[:] = m.groups()[group : group + len(specs)]
+    return route, specs
 
 
 def _compile_pattern(
     path: str,
-) -> tuple[re.Pattern[str], dict[str, Callable[[str], Any]]]:
-    """Compile ``/users/{id:int}`` into a regex + converter dict."""
-    converters: dict[str, Callable[[str], Any]] = {}
+) -> tuple[re.Pattern[str], tuple[tuple[str, Callable[[str], Any]], ...]]:
+    """Compile ``/users/{id:int}`` into a regex and ordered ``(name, converter)`` pairs."""
+    source, specs = _pattern_source(path, named=True)
+    return re.compile("^" + source + "$"), tuple(specs)
+
+
+def _pattern_source(
+    path: str,
+    *,
+    named: bool,
+) -> tuple[str, list[tuple[str, Callable[[str], Any]]]]:
+    """Translate *path* into unanchored regex source plus ordered ``(name, converter)`` pairs.
+
+    With ``named=False`` the parameter groups are plain capturing groups so
+    several sources can be joined into one alternation without name clashes.
+    """
+    specs: list[tuple[str, Callable[[str], Any]]] = []
     parts: list[str] = []
     last_end = 0
 
@@ -101,9 +438,54 @@ def _compile_pattern(
             raise ValueError(msg)
 
         regex, converter = _PARAM_TYPES[type_name]
-        parts.append(f"(?P<{name}>{regex})")
-        converters[name] = converter
+        parts.append(f"(?P<{name}>{regex})" if named else f"({regex})")
+        specs.append((name, converter))
         last_end = m.end()
 
     parts.append(re.escape(path[last_end:]))
-    return re.compile("^" + "".join(parts) + "$"), converters
+    return "".join(parts), specs
+
+
+def _combine(routes: list[Route], compile_: Callable[[str], Any]) -> _Combined:
+    """Pack *routes* into one anchored alternation, first route leftmost.
+
+    Each route becomes an outer capturing group; ``match.lastindex`` names the
+    outer group that matched and its parameters are the groups right after it.
+    The returned list is indexed by group number, holding each route at its
+    outer group and ``None`` elsewhere, so dispatch is a single list index.
+    """
+    alternatives: list[str] = []
+    owners: list[Route | None] = [None]  # group 0 is the whole match
+    for route in routes:
+        source, specs = _pattern_source(route.path, named=False)
+        alternatives.append(f"({source})")
+        owners.append(route)
+        owners.extend([None] * len(specs))
+    return compile_("^(?:" + "|".join(alternatives) + ")$"), owners
+
+
+def _split_segments(path: str) -> tuple[tuple[_Segment, ...], str | None]:
+    """Split *path* on ``/`` into trie segments and the regex tier, if any.
+
+    When a segment cannot be expressed in the tree, only the segments before
+    it are returned, along with the tier the route ranks in at that node:
+    ``"tail"`` if the segment holds a ``{name:path}``, else ``"mixed"``.
+    """
+    raw = path.split("/")
+    segments: list[_Segment] = []
+    for i, part in enumerate(raw):
+        if "{" not in part:
+            segments.append(_Literal(sys.intern(part)))
+            continue
+        m = _PARAM_RE.fullmatch(part)
+        if m is None:
+            greedy = any(p.group(2) == "path" for p in _PARAM_RE.finditer(part))
+            return tuple(segments), "tail" if greedy else "mixed"
+        name, type_name = m.group(1), m.group(2) or "str"
+        if type_name == "path":
+            if i != len(raw) - 1:
+                return tuple(segments), "tail"
+            segments.append(_Catchall(name))
+        else:
+            segments.append(_Param(name, type_name, _PARAM_TYPES[type_name][1]))
+    return tuple(segments), None
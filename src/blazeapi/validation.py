@@ -18,11 +18,12 @@ def _is_basemodel(tp: Any) -> bool:
     return isinstance(tp, type) and issubclass(tp, BaseModel)
 
 
-def validate_handler_signature(func: Any, path: str, method: str) -> None:
+def validate_handler_signature(func: Any, path: str, method: str) -> Any:
     """Validate a handler's type annotations at route registration time.
 
     Raises :class:`TypeError` with an actionable message when the handler
-    violates strict-mode typing rules.
+    violates strict-mode typing rules.  Returns the validated return
+    annotation.
     """
     name = getattr(func, "__name__", repr(func))
     hints = get_type_hints(func)
@@ -88,3 +89,5 @@ def validate_handler_signature(func: Any, path: str, method: str) -> None:
                 f"e.g. {param_name}: {param_name.title()}Model.\n"
                 f"  Rejected types: dict, list, str, int, and other primitives.\n"
             )
+
+    return ret
@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import functools
+import re
+import threading
+
 import pytest
 from httpx import ASGITransport, AsyncClient
 from pydantic import BaseModel
 
-from blazeapi import BlazeAPI, JSONResponse, Request, Response, __version__
+from blazeapi import BlazeAPI, JSONResponse, Request, Response, __version__, routing, sync_fast
 from blazeapi.routing import Route, Router
 
 # =====================================================================
@@ -82,10 +86,218 @@ class TestRouter:
         assert router.match("GET", "/x") is None
         assert router.match("POST", "/x") is not None
 
+    def test_match_normalizes_method_case(self) -> None:
+        router = Router()
+        router.add_route("get", "/x/{id:int}", lambda: None)
+        assert router.match("GET", "/x/1") is not None
+        assert router.match("get", "/x/1") is not None
+        assert router.match("PATCH", "/x/1") is None
+
     def test_match_returns_none_for_unknown(self) -> None:
         router = Router()
         assert router.match("GET", "/nope") is None
 
+    def test_static_route_returns_empty_params(self) -> None:
+        router = Router()
+        router.add_route("GET", "/health", lambda: "static")
+        router.add_route("GET", "/{name}", lambda: "param")
+        result = router.match("GET", "/health")
+        assert result is not None
+        route, params = result
+        assert route.handler() == "static"
+        assert params == {}
+        assert router.match("POST", "/health") is None
+
+    def test_repeated_dynamic_match_is_cached(self) -> None:
+        router = Router()
+        router.add_route("GET", "/items/{id:int}", lambda: None)
+        first = router.match("GET", "/items/1")
+        second = router.match("GET", "/items/1")
+        assert first is not None
+        assert second is not None
+        assert second[1] is first[1]
+        result = router.match("GET", "/items/2")
+        assert result is not None
+        assert result[1] == {"id": 2}
+
+    def test_add_route_invalidates_cache(self) -> None:
+        router = Router()
+        router.add_route("GET", "/users/{name}/posts/{post_id:int}", lambda: "param")
+        result = router.match("GET", "/users/me/posts/1")
+        assert result is not None
+        assert result[0].handler() == "param"
+        router.add_route("GET", "/users/me/posts/{post_id:int}", lambda: "literal")
+        result = router.match("GET", "/users/me/posts/1")
+        assert result is not None
+        assert result[0].handler() == "literal"
+
+    def test_literal_preferred_over_param(self) -> None:
+        router = Router()
+        router.add_route("GET", "/users/{name}", lambda: "param")
+        router.add_route("GET", "/users/me", lambda: "literal")
+        result = router.match("GET", "/users/me")
+        assert result is not None
+        assert result[0].handler() == "literal"
+        result = router.match("GET", "/users/alice")
+        assert result is not None
+        assert result[0].handler() == "param"
+        assert result[1] == {"name": "alice"}
+
+    def test_backtracks_from_literal_to_param(self) -> None:
+        router = Router()
+        router.add_route("GET", "/users/me/settings", lambda: None)
+        router.add_route("GET", "/users/{user_id:int}/posts", lambda: None)
+        router.add_route("GET", "/users/{name}/posts", lambda: None)
+        result = router.match("GET", "/users/7/posts")
+        assert result is not None
+        assert result[1] == {"user_id": 7}
+        result = router.match("GET", "/users/me/posts")
+        assert result is not None
+        assert result[1] == {"name": "me"}
+
+    def test_int_segment_validation(self) -> None:
+        router = Router()
+        router.add_route("GET", "/items/{id:int}", lambda: None)
+        result = router.match("GET", "/items/-3")
+        assert result is not None
+        assert result[1] == {"id": -3}
+        assert router.match("GET", "/items/-") is None
+        assert router.match("GET", "/items/1.5") is None
+        assert router.match("GET", "/items/abc") is None
+
+    def test_catchall_after_params(self) -> None:
+        router = Router()
+        router.add_route("GET", "/files/{filepath:path}", lambda: None)
+        router.add_route("GET", "/files/{name}", lambda: None)
+        result = router.match("GET", "/files/a.txt")
+        assert result is not None
+        assert result[0].path == "/files/{name}"
+        result = router.match("GET", "/files/a/b.txt")
+        assert result is not None
+        assert result[1] == {"filepath": "a/b.txt"}
+        assert router.match("GET", "/files/") is None
+
+    def test_mixed_segment_falls_back_to_regex(self) -> None:
+        router = Router()
+        router.add_route("GET", "/reports/{year:int}.csv", lambda: None)
+        router.add_route("GET", "/files/{filepath:path}/raw", lambda: None)
+        result = router.match("GET", "/reports/2024.csv")
+        assert result is not None
+        assert result[1] == {"year": 2024}
+        result = router.match("GET", "/files/a/b/raw")
+        assert result is not None
+        assert result[1] == {"filepath": "a/b"}
+        assert router.match("GET", "/reports/x.csv") is None
+
+        # Plain-param and catch-all siblings must not shadow the regex routes.
+        router.add_route("GET", "/reports/{name}", lambda: None)
+        router.add_route("GET", "/files/{rest:path}", lambda: None)
+        result = router.match("GET", "/reports/2024.csv")
+        assert result is not None
+        assert result[1] == {"year": 2024}
+        result = router.match("GET", "/files/a/b/raw")
+        assert result is not None
+        assert result[1] == {"filepath": "a/b"}
+        result = router.match("GET", "/reports/x.csv")
+        assert result is not None
+        assert result[1] == {"name": "x.csv"}
+        result = router.match("GET", "/files/a/b")
+        assert result is not None
+        assert result[1] == {"rest": "a/b"}
+
+    def test_mixed_segment_ranks_above_param_and_catchall(self) -> None:
+        router = Router()
+        router.add_route("GET", "/reports/{year:int}.csv", lambda: "csv")
+        router.add_route("GET", "/reports/{name}", lambda: "name")
+        router.add_route("GET", "/reports/latest.csv", lambda: "literal")
+        router.add_route("GET", "/static/{p:path}", lambda: "any")
+        router.add_route("GET", "/static/{name}.css", lambda: "css")
+        for path, expected, params in [
+            ("/reports/2024.csv", "csv", {"year": 2024}),
+            ("/reports/latest.csv", "literal", {}),
+            ("/reports/x.csv", "name", {"name": "x.csv"}),
+            ("/static/site.css", "css", {"name": "site"}),
+            ("/static/img/a.png", "any", {"p": "img/a.png"}),
+        ]:
+            result = router.match("GET", path)
+            assert result is not None
+            assert result[0].handler() == expected
+            assert result[1] == params
+
+    def test_mid_path_catchall_ranks_below_param(self) -> None:
+        router = Router()
+        router.add_route("GET", "/files/{filepath:path}/raw", lambda: "tail")
+        router.add_route("GET", "/files/{name}/raw", lambda: "param")
+        result = router.match("GET", "/files/a/raw")
+        assert result is not None
+        assert result[0].handler() == "param"
+        result = router.match("GET", "/files/a/b/raw")
+        assert result is not None
+        assert result[0].handler() == "tail"
+        assert result[1] == {"filepath": "a/b"}
+
+    def test_enable_re2_compiles_fallback_with_engine(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        compiled: list[str] = []
+
+        class FakeRE2:
+            @staticmethod
+            def compile(pattern: str):
+                compiled.append(pattern)
+                return re.compile(pattern, re.ASCII)  # RE2's \d is ASCII-only too
+
+        monkeypatch.setattr(routing, "re2", FakeRE2)
+        router = Router()
+        router.add_route("GET", "/reports/{year:int}.csv", lambda: None)
+        arabic_indic = "/reports/\u0662\u0660\u0662\u0664.csv"
+        result = router.match("GET", arabic_indic)
+        assert result is not None
+        assert result[1] == {"year": 2024}
+        router.enable_re2()
+        result = router.match("GET", "/reports/2024.csv")
+        assert result is not None
+        assert result[1] == {"year": 2024}
+        assert router.match("GET", arabic_indic) is None  # not served from the pre-switch cache
+        assert len(compiled) == 1
+
+    def test_combined_regex_built_lazily(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        compiled: list[str] = []
+
+        class FakeRE2:
+            @staticmethod
+            def compile(pattern: str):
+                compiled.append(pattern)
+                return re.compile(pattern)
+
+        monkeypatch.setattr(routing, "re2", FakeRE2)
+        router = Router()
+        router.enable_re2()
+        for ext in ("csv", "json", "xml"):
+            router.add_route("GET", f"/reports/{{year:int}}.{ext}", lambda: None)
+        assert compiled == []
+        result = router.match("GET", "/reports/2024.xml")
+        assert result is not None
+        assert result[1] == {"year": 2024}
+        assert router.match("GET", "/reports/2025.json") is not None
+        assert len(compiled) == 1
+
+    def test_enable_re2_requires_extra(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(routing, "re2", None)
+        with pytest.raises(RuntimeError, match="google-re2"):
+            Router().enable_re2()
+
+    def test_fallback_routes_keep_registration_order(self) -> None:
+        router = Router()
+        router.add_route("GET", "/v{major:int}.{minor:int}", lambda: "version")
+        router.add_route("GET", "/v{name}.{ext}", lambda: "named")
+        result = router.match("GET", "/v1.2")
+        assert result is not None
+        assert result[0].handler() == "version"
+        assert result[1] == {"major": 1, "minor": 2}
+        result = router.match("GET", "/vx.json")
+        assert result is not None
+        assert result[0].handler() == "named"
+        assert result[1] == {"name": "x", "ext": "json"}
+
 
 # =====================================================================
 # ASGI end-to-end
@@ -127,6 +339,47 @@ async def test_path_params() -> None:
         assert resp.json() == {"id": 42}
 
 
+@pytest.mark.asyncio
+async def test_handler_shared_across_paths() -> None:
+    app = BlazeAPI()
+
+    @app.get("/items")
+    @app.get("/items/{item_id:int}")
+    async def items(item_id: int | None = None) -> JSONResponse:
+        return JSONResponse({"id": item_id})
+
+    async with _make_client(app) as client:
+        assert (await client.get("/items")).json() == {"id": None}
+        assert (await client.get("/items/3")).json() == {"id": 3}
+
+
+@pytest.mark.asyncio
+async def test_wrapped_and_method_handlers() -> None:
+    app = BlazeAPI()
+
+    def logged(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            return await fn(*args, **kwargs)
+
+        return wrapper
+
+    @app.get("/wrapped/{item_id:int}")
+    @logged
+    async def wrapped(request: Request, item_id: int) -> JSONResponse:
+        return JSONResponse({"id": item_id, "path": request.path})
+
+    class Views:
+        async def show(self, item_id: int) -> JSONResponse:
+            return JSONResponse({"id": item_id})
+
+    app.get("/method/{item_id:int}")(Views().show)
+
+    async with _make_client(app) as client:
+        assert (await client.get("/wrapped/5")).json() == {"id": 5, "path": "/wrapped/5"}
+        assert (await client.get("/method/6")).json() == {"id": 6}
+
+
 @pytest.mark.asyncio
 async def test_404() -> None:
     app = BlazeAPI()
@@ -151,6 +404,20 @@ async def test_500_on_handler_error() -> None:
         assert "Internal Server Error" in resp.json()["detail"]
 
 
+@pytest.mark.asyncio
+async def test_500_includes_traceback_in_debug() -> None:
+    app = BlazeAPI(debug=True)
+
+    @app.get("/boom")
+    async def boom(request: Request) -> Response:
+        raise RuntimeError("kaboom")
+
+    async with _make_client(app) as client:
+        resp = await client.get("/boom")
+        assert resp.status_code == 500
+        assert "RuntimeError: kaboom" in resp.json()["traceback"]
+
+
 @pytest.mark.asyncio
 async def test_sync_handler() -> None:
     app = BlazeAPI()
@@ -165,6 +432,63 @@ async def test_sync_handler() -> None:
         assert resp.json() == {"sync": True}
 
 
+@pytest.mark.asyncio
+async def test_sync_fast_handler_runs_on_loop_thread() -> None:
+    app = BlazeAPI()
+    loop_thread = threading.get_ident()
+
+    @app.get("/fast")
+    @sync_fast
+    def fast(request: Request) -> JSONResponse:
+        return JSONResponse({"same_thread": threading.get_ident() == loop_thread})
+
+    @app.get("/slow")
+    def slow(request: Request) -> JSONResponse:
+        return JSONResponse({"same_thread": threading.get_ident() == loop_thread})
+
+    @sync_fast
+    @app.get("/fast-outer")
+    def fast_outer(request: Request) -> JSONResponse:
+        return JSONResponse({"same_thread": threading.get_ident() == loop_thread})
+
+    async with _make_client(app) as client:
+        assert (await client.get("/fast")).json() == {"same_thread": True}
+        assert (await client.get("/slow")).json() == {"same_thread": False}
+        assert (await client.get("/fast-outer")).json() == {"same_thread": True}
+        assert (await client.get("/slow")).json() == {"same_thread": False}
+
+
+@pytest.mark.asyncio
+async def test_request_not_built_for_handlers_without_it(monkeypatch: pytest.MonkeyPatch) -> None:
+    import blazeapi.app
+
+    built: list[Request] = []
+
+    class RecordingRequest(Request):
+        __slots__ = ()
+
+        def __init__(self, *args: object) -> None:
+            super().__init__(*args)  # type: ignore[arg-type]
+            built.append(self)
+
+    monkeypatch.setattr(blazeapi.app, "Request", RecordingRequest)
+    app = BlazeAPI()
+
+    @app.get("/bare/{item_id:int}")
+    async def bare(item_id: int) -> dict:
+        return {"id": item_id}
+
+    @app.get("/with")
+    async def with_request(request: Request) -> dict:
+        return {"path": request.path}
+
+    async with _make_client(app) as client:
+        assert (await client.get("/bare/3")).json() == {"id": 3}
+        assert built == []
+        assert (await client.get("/with")).json() == {"path": "/with"}
+        assert len(built) == 1
+
+
 @pytest.mark.asyncio
 async def test_dict_return_auto_json() -> None:
     app = BlazeAPI()
@@ -247,6 +571,50 @@ def test_strict_mode_accepts_response_subclass() -> None:
     assert len(app.router.routes) == 1
 
 
+class StrictItem(BaseModel):
+    name: str
+
+
+@pytest.mark.asyncio
+async def test_strict_mode_serializes_model_return() -> None:
+    app = BlazeAPI(strict=True)
+
+    @app.get("/item")
+    async def get_item(request: Request) -> StrictItem:
+        return StrictItem(name="Widget")
+
+    @app.get("/text")
+    async def get_text(request: Request) -> Response:
+        return Response(b"plain")
+
+    async with _make_client(app) as client:
+        resp = await client.get("/item")
+        assert resp.headers["content-type"] == "application/json"
+        assert resp.json() == {"name": "Widget"}
+        assert (await client.get("/text")).content == b"plain"
+
+
+@pytest.mark.asyncio
+async def test_strict_mode_mismatched_return_falls_back() -> None:
+    app = BlazeAPI(strict=True)
+
+    @app.get("/dict")
+    async def get_dict(request: Request) -> JSONResponse:
+        return {"ok": True}  # type: ignore[return-value]
+
+    @app.get("/text")
+    async def get_text(request: Request) -> StrictItem:
+        return "plain"  # type: ignore[return-value]
+
+    async with _make_client(app) as client:
+        resp = await client.get("/dict")
+        assert resp.status_code == 200
+        assert resp.json() == {"ok": True}
+        resp = await client.get("/text")
+        assert resp.status_code == 200
+        assert resp.content == b"plain"
+
+
 # =====================================================================
 # Middleware
 # =====================================================================
@@ -281,6 +649,80 @@ async def test_middleware() -> None:
         assert resp.headers["x-custom"] == "yes"
 
 
+@pytest.mark.asyncio
+async def test_middleware_chain_built_once() -> None:
+    app = BlazeAPI()
+    calls: list[str] = []
+
+    @app.get("/mw")
+    async def handler(request: Request) -> JSONResponse:
+        return JSONResponse({"ok": True})
+
+    def counting_middleware(name):
+        def factory(inner_app):
+            calls.append(name)
+            return inner_app
+
+        return factory
+
+    app.add_middleware(counting_middleware("first"))
+
+    async with _make_client(app) as client:
+        await client.get("/mw")
+        await client.get("/mw")
+        assert calls == ["first"]
+
+        app.add_middleware(counting_middleware("second"))
+        await client.get("/mw")
+        assert calls == ["first", "second", "first"]
+
+
+@pytest.mark.asyncio
+async def test_pre_and_post_hooks() -> None:
+    app = BlazeAPI()
+    events: list[str] = []
+
+    @app.get("/hooked")
+    async def handler(request: Request) -> JSONResponse:
+        events.append("handler")
+        return JSONResponse({"ok": True})
+
+    async def pre(scope):
+        events.append(f"pre {scope['path']}")
+
+    async def post(scope):
+        events.append("post")
+
+    app.add_pre_hook(pre)
+    app.add_post_hook(post)
+
+    async with _make_client(app) as client:
+        resp = await client.get("/hooked")
+        assert resp.status_code == 200
+        assert events == ["pre /hooked", "handler", "post"]
+
+
+@pytest.mark.asyncio
+async def test_hooks_skip_non_http_scopes() -> None:
+    app = BlazeAPI()
+    events: list[str] = []
+
+    async def hook(scope):
+        events.append(scope["type"])
+
+    app.add_pre_hook(hook)
+    app.add_post_hook(hook)
+
+    async def receive() -> dict:
+        return {"type": "websocket.connect"}
+
+    async def send(message: dict) -> None:
+        events.append(message["type"])
+
+    await app({"type": "websocket", "path": "/ws"}, receive, send)
+    assert events == []
+
+
 # =====================================================================
 # All HTTP methods
 # =====================================================================
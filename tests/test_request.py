@@ -0,0 +1,182 @@
+"""Tests for the ASGI Request wrapper."""
+
+from __future__ import annotations
+
+from urllib.parse import parse_qs
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from blazeapi.request import Request
+
+
+class _Item(BaseModel):
+    name: str
+    price: float
+
+
+def _body_receiver(*chunks: bytes):
+    messages = [{"type": "http.request", "body": c, "more_body": i < len(chunks) - 1} for i, c in enumerate(chunks)]
+
+    async def receive() -> dict:
+        return messages.pop(0)
+
+    return receive
+
+
+def _scope(query_string: bytes = b"", headers: list[tuple[bytes, bytes]] | None = None) -> dict:
+    return {
+        "type": "http",
+        "method": "POST",
+        "path": "/items",
+        "query_string": query_string,
+        "headers": headers or [],
+    }
+
+
+def _request(query_string: bytes = b"", headers: list[tuple[bytes, bytes]] | None = None) -> Request:
+    return Request(_scope(query_string, headers), _body_receiver(b""))
+
+
+def test_scope_fields() -> None:
+    request = _request(b"a=1")
+    assert request.method == "POST"
+    assert request.path == "/items"
+    assert request.query_string == b"a=1"
+
+
+def test_missing_path_params_share_read_only_mapping() -> None:
+    first, second = _request(), _request()
+    assert first.path_params == {}
+    assert first.path_params is second.path_params
+    with pytest.raises(TypeError):
+        first.path_params["x"] = 1  # type: ignore[index]
+    params = {"id": 1}
+    assert Request(_scope(), _body_receiver(b""), params).path_params is params
+
+
+# -- Query params ---------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "qs",
+    [
+        "",
+        "a=1",
+        "a=1&b=2&a=3",
+        "a=&b=2",
+        "flag&x=1",
+        "=v&&k=v",
+        "q=hello+world&sp=%20x%2By",
+        "na%C3%AFve=caf%C3%A9",
+        "bad=%zz&ok=1",
+        "k=a=b",
+        "sem=1;2",
+    ],
+)
+def test_query_params_match_parse_qs(qs: str) -> None:
+    assert _request(qs.encode("latin-1")).query_params == parse_qs(qs)
+
+
+def test_query_single_valued() -> None:
+    request = _request(b"page=2&tag=a&q=x+y&tag=b&tag=c&empty=")
+    assert request.query == {"page": "2", "tag": ["a", "b", "c"], "q": "x y"}
+    assert request.query is request.query
+
+
+def test_query_params_parsed_once() -> None:
+    request = _request(b"a=1")
+    assert request.query_params is request.query_params
+
+
+# -- Headers --------------------------------------------------------------
+
+
+def test_headers_last_value_wins() -> None:
+    request = _request(headers=[(b"x-dup", b"1"), (b"host", b"example.com"), (b"x-dup", b"2")])
+    assert request.headers == {"x-dup": "2", "host": "example.com"}
+    assert request.headers is request.headers
+
+
+def test_get_header() -> None:
+    request = _request(headers=[(b"x-dup", b"1"), (b"content-type", b"text/plain"), (b"x-dup", b"2")])
+    assert request.get_header("content-type") == "text/plain"
+    assert request.get_header("Content-Type") == "text/plain"
+    assert request.get_header("x-dup") == "2"
+    assert request.get_header("missing") is None
+
+
+def test_headers_non_ascii_fall_back_to_latin1() -> None:
+    request = _request(headers=[(b"x-name", "caf\xe9".encode("latin-1"))])
+    assert request.headers == {"x-name": "caf\xe9"}
+
+
+# -- Body -----------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_body_joins_chunks_and_caches() -> None:
+    request = Request(_scope(), _body_receiver(b"ab", b"", b"cd"))
+    body = await request.body()
+    assert body == b"abcd"
+    assert type(body) is bytes
+    assert await request.body() is body
+
+
+@pytest.mark.asyncio
+async def test_single_message_body_is_not_copied() -> None:
+    payload = b"x" * 64
+    request = Request(_scope(), _body_receiver(payload))
+    assert await request.body() is payload
+
+
+@pytest.mark.asyncio
+async def test_empty_body_is_cached() -> None:
+    request = Request(_scope(), _body_receiver(b""))
+    assert await request.body() == b""
+    assert await request.body() == b""  # would pop from an empty receiver if re-read
+    assert [chunk async for chunk in request.stream()] == []
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_chunks_once() -> None:
+    request = Request(_scope(), _body_receiver(b"ab", b"", b"cd"))
+    assert [chunk async for chunk in request.stream()] == [b"ab", b"cd"]
+    with pytest.raises(RuntimeError):
+        [chunk async for chunk in request.stream()]
+    with pytest.raises(RuntimeError):
+        await request.body()
+
+
+@pytest.mark.asyncio
+async def test_stream_after_body_replays_cache() -> None:
+    request = Request(_scope(), _body_receiver(b"ab", b"cd"))
+    body = await request.body()
+    assert [chunk async for chunk in request.stream()] == [body]
+    assert [chunk async for chunk in request.stream()] == [body]
+
+
+@pytest.mark.asyncio
+async def test_text_decodes_and_caches() -> None:
+    request = Request(_scope(), _body_receiver("café".encode()))
+    text = await request.text()
+    assert text == "café"
+    assert await request.text() is text
+    assert await request.text("latin-1") == "cafÃ©"
+
+
+@pytest.mark.asyncio
+async def test_json_parses_body() -> None:
+    request = Request(_scope(), _body_receiver(b'{"a": [1, 2', b', "x"]}'))
+    assert await request.json() == {"a": [1, 2, "x"]}
+
+
+@pytest.mark.asyncio
+async def test_json_as_validates_into_model() -> None:
+    request = Request(_scope(), _body_receiver(b'{"name": "w", "price": 2}'))
+    item = await request.json_as(_Item)
+    assert item == _Item(name="w", price=2.0)
+
+    bad = Request(_scope(), _body_receiver(b'{"name": "w"}'))
+    with pytest.raises(ValidationError):
+        await bad.json_as(_Item)